@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import argparse
+from multiprocessing import Pool
+import os
 
 from . import __app_name__, __version__
-from .simplifier import LogicGateSimplifier
+from .cli import _solve_problem
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -62,52 +64,6 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _print_equations(equations: list[dict[str, str]], output: str) -> None:
-    """Print equation dicts to stdout according to output format (string, latex, or both)."""
-    for idx, equation in enumerate(equations, start=1):
-        if len(equations) > 1:
-            print(f"Cover {idx}")
-        if output in ("string", "both"):
-            print(equation["string"])
-        if output in ("latex", "both"):
-            print(equation["latex"])
-        if idx < len(equations):
-            print()
-
-
-def _run_problem(
-    variables_str: str,
-    minterms_str: str,
-    output: str,
-    show_all: bool,
-    pichart: str | None,
-    pitable: str | None,
-    essentials: str | None,
-) -> None:
-    """Build simplifier, simplify, print equations and optional PI table/essentials/chart."""
-    simplifier = LogicGateSimplifier.from_strings(variables_str, minterms_str)
-    simplifier.simplify()
-    equations = simplifier.get_all_equations()
-    if not show_all:
-        equations = equations[:1]
-    _print_equations(equations, output)
-
-    if pitable == "terminal":
-        print()
-        print("Prime implicants")
-        print(simplifier.get_prime_implicants_terminal())
-    if essentials == "terminal":
-        print()
-        print("Essential prime implicants")
-        print(simplifier.get_essentials_terminal())
-    if pichart == "terminal":
-        print()
-        print(simplifier.get_pichart_terminal(tick="x"))
-    elif pichart == "latex":
-        print()
-        print(simplifier.get_pichart_latex())
-
-
 def main() -> None:
     """Parse CLI args and run demo or single problem; print version and exit if --version."""
     parser = _build_parser()
@@ -124,32 +80,23 @@ def main() -> None:
         ("A,B,C,D", "0,2,4,5,6,7,8,10,13,15"),
     ]
 
+    options = (args.output, args.all, args.pichart, args.pitable, args.essentials)
+
     if args.demo:
-        for variables_str, minterms_str in demo_problems:
-            _run_problem(
-                variables_str,
-                minterms_str,
-                args.output,
-                args.all,
-                args.pichart,
-                args.pitable,
-                args.essentials,
+        with Pool(min(len(demo_problems), os.cpu_count() or 1)) as pool:
+            outputs = pool.starmap(
+                _solve_problem,
+                [(*problem, *options) for problem in demo_problems],
             )
+        for text in outputs:
+            print(text)
             print()
         return
 
     if not args.variables or not args.minterms:
         parser.error("Provide --vars and --minterms, or use --demo.")
 
-    _run_problem(
-        args.variables,
-        args.minterms,
-        args.output,
-        args.all,
-        args.pichart,
-        args.pitable,
-        args.essentials,
-    )
+    print(_solve_problem(args.variables, args.minterms, *options))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""Problem solving and output formatting shared by the LogicLoom CLI and its demo workers."""
+
+from __future__ import annotations
+
+from .simplifier import LogicGateSimplifier
+
+
+def _format_equations(equations: list[dict[str, str]], output: str) -> str:
+    """Format equation dicts according to output format (string, latex, or both)."""
+    lines: list[str] = []
+    for idx, equation in enumerate(equations, start=1):
+        if len(equations) > 1:
+            lines.append(f"Cover {idx}")
+        if output in ("string", "both"):
+            lines.append(equation["string"])
+        if output in ("latex", "both"):
+            lines.append(equation["latex"])
+        if idx < len(equations):
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _solve_problem(
+    variables_str: str,
+    minterms_str: str,
+    output: str,
+    show_all: bool,
+    pichart: str | None,
+    pitable: str | None,
+    essentials: str | None,
+) -> str:
+    """Build simplifier, simplify, and return equations and optional PI table/essentials/chart as text."""
+    simplifier = LogicGateSimplifier.from_strings(variables_str, minterms_str)
+    simplifier.simplify()
+    equations = simplifier.get_all_equations()
+    if not show_all:
+        equations = equations[:1]
+    sections = [_format_equations(equations, output)]
+
+    if pitable == "terminal":
+        sections.append(
+            "\nPrime implicants\n" + simplifier.get_prime_implicants_terminal()
+        )
+    if essentials == "terminal":
+        sections.append(
+            "\nEssential prime implicants\n" + simplifier.get_essentials_terminal()
+        )
+    if pichart == "terminal":
+        sections.append("\n" + simplifier.get_pichart_terminal(tick="x"))
+    elif pichart == "latex":
+        sections.append("\n" + simplifier.get_pichart_latex())
+    return "\n".join(sections)
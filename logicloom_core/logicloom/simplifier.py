@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from itertools import pairwise
+from collections.abc import Iterator
 import math
+from operator import attrgetter
 
-from .utils import normalize_variables, normalize_minterms
+from .utils import iter_bits, normalize_variables, normalize_minterms
 
 from .types import PIChartData, PIChartRow, Term
 
@@ -30,7 +31,7 @@ class LogicGateSimplifier:
     ) -> None:
         """Initialize with minterm numbers and variable names; validates variable count vs max minterm."""
         self.variables: list[str] = normalize_variables(variables)
-        num_vars = len(variables)
+        num_vars = len(self.variables)
         if num_vars != int(math.log2(max(minterms))) + 1:
             raise ValueError(
                 f"Number of variables ({num_vars}) does not match max minterm ({max(minterms)})."
@@ -45,11 +46,17 @@ class LogicGateSimplifier:
         self.pichart: list[PIChartRow] = list()
         self._minimal_cover: list[Term] = []
         self._all_minimal_covers: list[list[Term]] = []
+        self._pis_sorted: list[Term] | None = None
+        self._pichart_data: PIChartData | None = None
         self._has_run: bool = False
 
     def simplify(self) -> list[Term]:
         """Run grouping and Petrick; return one minimal cover and populate prime_implicants/essentials/pichart."""
-        groups: list[list[Term]] = self._make_groups_by_count_of_1(self.main_minterms)
+        self._pis_sorted = None
+        self._pichart_data = None
+        groups: dict[int, set[tuple[int, int]]] = self._make_groups_by_count_of_1(
+            self.main_minterms
+        )
         self._get_prime_implicants(groups)
         self._get_essentials(self.prime_implicants, self.main_minterms)
 
@@ -111,16 +118,31 @@ class LogicGateSimplifier:
         """Return PIChartData (minterm numbers, PI labels, coverage matrix); runs simplify() if not yet run."""
         if not self._has_run:
             self.simplify()
-        pis_sorted = sorted(self.prime_implicants, key=lambda t: t.binary_form)
+        if self._pichart_data is not None:
+            return self._pichart_data
+        pis_sorted = self._get_pis_sorted()
         minterm_nums = [row.minterm.number for row in self.pichart]
-        matrix = [
-            [pi in row.prime_implicants for pi in pis_sorted] for row in self.pichart
-        ]
-        return PIChartData(
+        pi_columns = {pi: j for j, pi in enumerate(pis_sorted)}
+        matrix: list[list[bool]] = []
+        for row in self.pichart:
+            marks = [False] * len(pis_sorted)
+            for pi in row.prime_implicants:
+                marks[pi_columns[pi]] = True
+            matrix.append(marks)
+        self._pichart_data = PIChartData(
             minterm_numbers=minterm_nums,
             prime_implicants=[t.binary_form for t in pis_sorted],
             matrix=matrix,
         )
+        return self._pichart_data
+
+    def _get_pis_sorted(self) -> list[Term]:
+        """Return prime implicants sorted by binary form, computed once per simplify() run."""
+        if self._pis_sorted is None:
+            self._pis_sorted = sorted(
+                self.prime_implicants, key=attrgetter("binary_form")
+            )
+        return self._pis_sorted
 
     def get_pichart_latex(self, tick: str = r"$\checkmark$") -> str:
         """Return LaTeX tabular for the prime implicant chart; runs simplify() if not yet run."""
@@ -162,7 +184,7 @@ class LogicGateSimplifier:
         binary_minterms = [row.minterm.binary_form for row in self.pichart]
         binary_minterms.sort()
         headers = ["Minterm"] + data.prime_implicants
-        all_rows = [headers] + [
+        rows = [
             [binary_minterms[i]]
             + [
                 tick if data.matrix[i][j] else ""
@@ -170,60 +192,31 @@ class LogicGateSimplifier:
             ]
             for i in range(len(data.minterm_numbers))
         ]
-        col_widths = [
-            max(len(str(all_rows[r][c])) for r in range(len(all_rows)))
-            for c in range(len(headers))
-        ]
-        col_widths = [max(w, 2) for w in col_widths]
-
-        def pad(s: str, w: int) -> str:
-            return str(s).center(w)
-
-        top = "┌" + "┬".join("─" * (w + 2) for w in col_widths) + "┐"
-        mid = "├" + "┼".join("─" * (w + 2) for w in col_widths) + "┤"
-        bot = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
-
-        lines = [top]
-        for ri, row in enumerate(all_rows):
-            cells = [pad(row[c], col_widths[c]) for c in range(len(headers))]
-            lines.append("│ " + " │ ".join(cells) + " │")
-            if ri < len(all_rows) - 1:
-                lines.append(mid)
-        lines.append(bot)
-        return "\n".join(lines)
+        return self._terminal_table(headers, rows)
 
     def _terminal_table(self, headers: list[str], rows: list[list[str]]) -> str:
         """Build a box-drawing terminal table from headers and row cells."""
-        all_rows = [headers] + rows
+        cells = [[str(c) for c in row] for row in [headers, *rows]]
         col_widths = [
-            max(len(str(all_rows[r][c])) for r in range(len(all_rows)))
-            for c in range(len(headers))
+            max(max(len(row[c]) for row in cells), 2) for c in range(len(headers))
         ]
-        col_widths = [max(w, 2) for w in col_widths]
-
-        def pad(s: str, w: int) -> str:
-            return str(s).center(w)
 
         top = "┌" + "┬".join("─" * (w + 2) for w in col_widths) + "┐"
         mid = "├" + "┼".join("─" * (w + 2) for w in col_widths) + "┤"
         bot = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
-        lines = [top]
-        for ri, row in enumerate(all_rows):
-            cells = [pad(row[c], col_widths[c]) for c in range(len(headers))]
-            lines.append("│ " + " │ ".join(cells) + " │")
-            if ri < len(all_rows) - 1:
-                lines.append(mid)
-        lines.append(bot)
-        return "\n".join(lines)
+        body = f"\n{mid}\n".join(
+            "│ " + " │ ".join(c.center(w) for c, w in zip(row, col_widths)) + " │"
+            for row in cells
+        )
+        return f"{top}\n{body}\n{bot}"
 
     def get_prime_implicants_terminal(self) -> str:
         """Return prime implicants table (binary and literal form) as a terminal string."""
         if not self._has_run:
             self.simplify()
-        pis_sorted = sorted(self.prime_implicants, key=lambda t: t.binary_form)
         rows = [
             [t.binary_form, t.to_normal_expression(self.variables)]
-            for t in pis_sorted
+            for t in self._get_pis_sorted()
         ]
         return self._terminal_table(["Binary", "Literal"], rows)
 
@@ -237,67 +230,69 @@ class LogicGateSimplifier:
         ]
         return self._terminal_table(["Binary", "Literal"], rows)
 
-    def _product_two_sets(self, set1: set[Term], set2: set[Term]) -> list[set[Term]]:
-        """Return list of sets each being set1 union one element of set2."""
-        return [set1 | {j} for j in set2]
+    def _product_two_sets(self, set1: int, set2: int) -> list[int]:
+        """Return list of PI bitmasks each being set1 with one bit of set2 added."""
+        return [set1 | (1 << j) for j in iter_bits(set2)]
 
-    def _is_superset(self, set1: set[Term], set2: set[Term]) -> bool:
-        """Return True if set1 is a superset of set2."""
-        return len(set1) >= len(set2) and set2.issubset(set1)
+    def _is_superset(self, set1: int, set2: int) -> bool:
+        """Return True if PI bitmask set1 is a superset of set2."""
+        return set1 & set2 == set2
 
-    def _remove_supersets(self, list_of_sets: list[set[Term]]) -> list[set[Term]]:
-        """Return list with any set that is a superset of another removed."""
+    def _remove_supersets(self, list_of_sets: list[int]) -> list[int]:
+        """Return list with any PI bitmask that is a superset of another removed."""
         if len(list_of_sets) <= 1:
             return list_of_sets
-        sorted_sets = sorted(list_of_sets, key=len)
-        result: list[set[Term]] = []
-        for i, current_set in enumerate(sorted_sets):
-            is_superset_of_other = False
-            for j in range(i):
-                if self._is_superset(current_set, sorted_sets[j]):
-                    is_superset_of_other = True
-                    break
-            if not is_superset_of_other:
+        sorted_sets = sorted(dict.fromkeys(list_of_sets), key=int.bit_count)
+        kept_by_count: dict[int, list[int]] = defaultdict(list)
+        result: list[int] = []
+        for current_set in sorted_sets:
+            count = current_set.bit_count()
+            if not any(
+                self._is_superset(current_set, kept)
+                for kept_count, bucket in kept_by_count.items()
+                if kept_count < count
+                for kept in bucket
+            ):
+                kept_by_count[count].append(current_set)
                 result.append(current_set)
         return result
 
-    def _product_all_sets(self, sets: list[set[Term]]) -> list[set[Term]]:
-        """Expand product of sets and remove supersets; used for Petrick sum-of-products."""
-        if len(sets) == 1:
-            return [{pi} for pi in sets[0]]
-        result: list[set[Term]] = [{i, j} for i in sets[0] for j in sets[1]]
-        result = self._remove_supersets(result)
-        for i in range(2, len(sets)):
-            temp: list[set[Term]] = []
+    def _product_all_sets(self, sets: list[int]) -> list[int]:
+        """Expand product of PI bitmasks and remove supersets; used for Petrick sum-of-products."""
+        result: list[int] = [0]
+        for row_set in sets:
+            temp: list[int] = []
             for term in result:
-                temp.extend(self._product_two_sets(term, sets[i]))
+                temp.extend(self._product_two_sets(term, row_set))
             result = self._remove_supersets(temp)
         return result
 
-    def _get_least_products_sets(
-        self, list_of_sets: list[set[Term]]
-    ) -> list[set[Term]]:
-        """Return those sets with minimum cardinality."""
+    def _get_least_products_sets(self, list_of_sets: list[int]) -> list[int]:
+        """Return those PI bitmasks with minimum number of set bits."""
         if len(list_of_sets) == 1:
             return list_of_sets
-        least_products_set_length = len(min(list_of_sets, key=len))
-        return [st for st in list_of_sets if len(st) == least_products_set_length]
+        least_products_set_length = min(st.bit_count() for st in list_of_sets)
+        return [
+            st for st in list_of_sets if st.bit_count() == least_products_set_length
+        ]
 
-    def _compute_count(self, _set: set[Term]) -> int:
-        """Return total literal count (0s + 1s) in binary forms of terms in the set."""
-        return sum(pi.binary_form.count("0") + pi.binary_form.count("1") for pi in _set)
+    def _compute_count(self, _set: int, pi_literals: list[int]) -> int:
+        """Return total literal count of the PIs selected by bitmask, given per-PI literal counts."""
+        return sum(pi_literals[i] for i in iter_bits(_set))
 
-    def _compute_literal_counts(self, list_of_sets: list[set[Term]]) -> list[int]:
-        """Return list of literal counts for each set."""
-        return [self._compute_count(st) for st in list_of_sets]
+    def _compute_literal_counts(
+        self, list_of_sets: list[int], pi_literals: list[int]
+    ) -> list[int]:
+        """Return list of literal counts for each PI bitmask."""
+        return [self._compute_count(st, pi_literals) for st in list_of_sets]
 
     def _get_least_literals_sets(
-        self, list_of_sets: list[set[Term]]
-    ) -> list[set[Term]]:
-        """Return those sets with minimum total literal count."""
+        self, list_of_sets: list[int], pi_literals: list[int]
+    ) -> list[int]:
+        """Return those PI bitmasks with minimum total literal count."""
         if len(list_of_sets) == 1:
             return list_of_sets
-        literal_counts = self._compute_literal_counts(list_of_sets)
+        literal_counts = self._compute_literal_counts(list_of_sets, pi_literals)
         min_length = min(literal_counts)
 
         return [st for lc, st in zip(literal_counts, list_of_sets) if lc == min_length]
@@ -307,10 +302,18 @@ class LogicGateSimplifier:
         table: list[PIChartRow],
     ) -> list[set[Term]]:
         """Apply Petrick's method to remaining chart rows; return minimal cover sets (least literals)."""
-        all_remains_pis: list[set[Term]] = [row.prime_implicants for row in table]
+        pis: list[Term] = list(
+            dict.fromkeys(pi for row in table for pi in row.prime_implicants)
+        )
+        pi_index: dict[Term, int] = {pi: i for i, pi in enumerate(pis)}
+        all_remains_pis: list[int] = [
+            sum(1 << pi_index[pi] for pi in row.prime_implicants) for row in table
+        ]
+        pi_literals: list[int] = [pi.literal_count for pi in pis]
         all_products = self._product_all_sets(all_remains_pis)
         all_least_products = self._get_least_products_sets(all_products)
-        return self._get_least_literals_sets(all_least_products)
+        solutions = self._get_least_literals_sets(all_least_products, pi_literals)
+        return [{pis[i] for i in iter_bits(sol)} for sol in solutions]
 
     def _marked_once(self, row: PIChartRow) -> Term | None:
         """Return the single prime implicant covering this row if exactly one, else None."""
@@ -324,9 +327,15 @@ class LogicGateSimplifier:
     ) -> list[PIChartRow]:
         """Build PI chart rows: for each minterm, set of covering prime implicants; all is_remaining True."""
         result: list[PIChartRow] = []
+        rows_by_value: dict[int, list[PIChartRow]] = defaultdict(list)
         for minterm in main_minterms:
-            covering_pis = {pi for pi in prime_implicants if pi.cover(minterm)}
-            result.append(PIChartRow(minterm, covering_pis, True))
+            row = PIChartRow(minterm, set(), True)
+            result.append(row)
+            rows_by_value[minterm.value].append(row)
+        for pi in prime_implicants:
+            for value in pi.iter_covered_values():
+                for row in rows_by_value.get(value, ()):
+                    row.prime_implicants.add(pi)
         return result
 
     def _mark_all_minterms_covered_by_pi(
@@ -340,53 +349,69 @@ class LogicGateSimplifier:
     def _get_essentials(
         self, prime_implicants: set[Term], main_minterms: list[Term]
     ) -> None:
-        """Build pichart and extract essential prime implicants by iteratively marking single-covered minterms."""
+        """Build pichart and extract essential prime implicants by marking single-covered minterms in one pass."""
         table: list[PIChartRow] = self._mark_terms(prime_implicants, main_minterms)
         self.pichart = table
+        rows_by_pi: dict[Term, list[PIChartRow]] = defaultdict(list)
+        for row in table:
+            for pi in row.prime_implicants:
+                rows_by_pi[pi].append(row)
         essentials: list[Term] = list()
 
-        while True:
-            for row in table:
-                if row.is_remaining and (pi := self._marked_once(row)):
-                    essentials.append(pi)
-                    self._mark_all_minterms_covered_by_pi(table, pi)
-                    break
-            else:
-                break
+        for row in table:
+            if row.is_remaining and (pi := self._marked_once(row)):
+                essentials.append(pi)
+                self._mark_all_minterms_covered_by_pi(rows_by_pi[pi], pi)
         self.essentials = essentials
 
-    def _make_groups_by_count_of_1(self, minterms: list[Term]) -> list[list[Term]]:
-        """Group minterms by number of 1s in binary form; return list of groups in order of count."""
-        groups: dict[int, list[Term]] = defaultdict(list)
+    def _make_groups_by_count_of_1(
+        self, minterms: list[Term]
+    ) -> dict[int, set[tuple[int, int]]]:
+        """Group minterms as (value, mask) pairs by number of 1s; return groups keyed by count."""
+        groups: dict[int, set[tuple[int, int]]] = defaultdict(set)
         for m in minterms:
-            count = m.binary_form.count("1")
-            groups[count].append(m)
+            groups[m.ones_count].add((m.value, m.mask))
 
-        return [group for _, group in sorted(groups.items())]
+        return dict(groups)
 
-    def _combine_groups(self, gp1: list[Term], gp2: list[Term]) -> list[Term]:
-        """Combine adjacent groups: terms that differ in one bit are merged (marked used); return new terms."""
-        combined_groups: list[Term] = []
+    def _combine_groups(
+        self,
+        gp1: set[tuple[int, int]],
+        gp2: set[tuple[int, int]],
+        used: set[tuple[int, int]],
+    ) -> Iterator[tuple[int, int]]:
+        """Combine adjacent groups by looking up each gp1 term's one-bit partners in gp2; yield merged terms."""
         for term1 in gp1:
-            for term2 in gp2:
-                if match_term := term1 + term2:
-                    term1.is_used = term2.is_used = True
-                    combined_groups.append(match_term)
-        return combined_groups
-
-    def _get_prime_implicants(self, groups: list[list[Term]]) -> None:
-        """Run grouping until no more combinations; set prime_implicants to unused terms."""
-        prime_implicants: set[Term] = set()
+            value, mask = term1
+            zeros = mask & ~value
+            while zeros:
+                bit = zeros & -zeros
+                zeros ^= bit
+                term2 = (value | bit, mask)
+                if term2 not in gp2:
+                    continue
+                used.add(term1)
+                used.add(term2)
+                yield (value, mask ^ bit)
+
+    def _get_prime_implicants(self, groups: dict[int, set[tuple[int, int]]]) -> None:
+        """Run grouping on (value, mask) pairs until no more combinations; set prime_implicants to unused terms."""
+        prime_bits: list[tuple[int, int]] = []
 
         while True:
-            stop: bool = True
-            new_group: list[list[Term]] = []
-            for g1, g2 in pairwise(groups):
-                if combined_terms := self._combine_groups(g1, g2):
-                    stop = False
-                    new_group.append(combined_terms)
-            prime_implicants.update(pi for gp in groups for pi in gp if not pi.is_used)
-            if stop:
+            used: set[tuple[int, int]] = set()
+            new_groups: dict[int, set[tuple[int, int]]] = {}
+            for count, g1 in groups.items():
+                g2 = groups.get(count + 1)
+                if g2 and (combined_terms := set(self._combine_groups(g1, g2, used))):
+                    new_groups[count] = combined_terms
+            prime_bits.extend(
+                term for gp in groups.values() for term in gp if term not in used
+            )
+            if not new_groups:
                 break
-            groups = new_group
-        self.prime_implicants = prime_implicants
+            groups = new_groups
+        length = len(self.variables)
+        self.prime_implicants = {
+            Term(value, mask, length) for value, mask in prime_bits
+        }
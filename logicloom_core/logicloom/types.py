@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from .utils import to_binary_form
@@ -26,32 +27,63 @@ class PIChartData:
 
 
 class Term:
-    """A single term (minterm or prime implicant) with binary form and optional decimal number."""
-
-    def __init__(self, binary_form: str, number: int | None = None) -> None:
-        self.binary_form: str = binary_form
+    """A single term (minterm or prime implicant) packed as value/mask bitmasks with optional decimal number.
+
+    Bit i of ``mask`` is 1 where the term has a literal and 0 where it has a '-';
+    bit i of ``value`` is 1 where that literal is '1'. The most significant of the
+    ``length`` bits corresponds to the first character of ``binary_form``.
+    """
+
+    def __init__(
+        self, value: int, mask: int, length: int, number: int | None = None
+    ) -> None:
+        self.value: int = value & mask
+        self.mask: int = mask
+        self.length: int = length
+        self.literal_count: int = mask.bit_count()
+        self.ones_count: int = self.value.bit_count()
         self.number: int | None = number
-        self.is_used: bool = False
+        self._binary_form: str | None = None
 
     @classmethod
     def from_number(cls, number: int, length: int = 0) -> Term:
         """Create a Term from a decimal minterm number and optional bit length."""
-        return cls(to_binary_form(number, length), number)
+        length = max(length, number.bit_length(), 1)
+        return cls(number, (1 << length) - 1, length, number)
 
     @classmethod
     def from_binary_form(cls, binary_form: str) -> Term:
         """Create a Term from a binary string (e.g. '01-0')."""
-        return cls(binary_form)
+        value = int(binary_form.replace("-", "0"), 2)
+        mask = int(binary_form.replace("0", "1").replace("-", "0"), 2)
+        return cls(value, mask, len(binary_form))
+
+    @property
+    def binary_form(self) -> str:
+        """Return the binary string (e.g. '01-0'); built on first access and cached."""
+        if self._binary_form is None:
+            self._binary_form = "".join(
+                bit if self.mask >> pos & 1 else "-"
+                for pos, bit in zip(
+                    range(self.length - 1, -1, -1),
+                    to_binary_form(self.value, self.length),
+                )
+            )
+        return self._binary_form
 
     def __eq__(self, other: object) -> bool:
-        """Two terms are equal if their binary_form strings are equal."""
+        """Two terms are equal if their value, mask and length are equal."""
         if not isinstance(other, Term):
             return NotImplemented
-        return self.binary_form == other.binary_form
+        return (
+            self.value == other.value
+            and self.mask == other.mask
+            and self.length == other.length
+        )
 
     def __hash__(self) -> int:
-        """Hash by binary_form for use in sets."""
-        return hash(self.binary_form)
+        """Hash by (value, mask) for use in sets."""
+        return hash((self.value, self.mask))
 
     def __getitem__(self, ind: int) -> str:
         """Return the character at index ind in binary_form."""
@@ -59,24 +91,32 @@ class Term:
 
     def __add__(self, other: Term) -> Term | None:
         """Combine two terms if they differ in exactly one bit; return combined term with '-' or None."""
-        res_list: list[str] = []
-        diff: bool = False
-        for i, j in zip(self.binary_form, other.binary_form):
-            if i == j:
-                res_list.append(i)
-            elif diff:
-                return None
-            else:
-                res_list.append("-")
-                diff = True
-        return Term.from_binary_form("".join(res_list))
+        if self.mask != other.mask:
+            return None
+        diff = self.value ^ other.value
+        if not diff or diff & (diff - 1):
+            return None
+        return Term(self.value & other.value, self.mask ^ diff, self.length)
 
     def cover(self, other: Term) -> bool:
         """Return True if this term (e.g. implicant) covers the other term (minterm)."""
-        return all(
-            i == j or i == "-" for i, j in zip(self.binary_form, other.binary_form)
+        if self.mask == other.mask:
+            return self.value == other.value
+        return (
+            self.mask & other.mask == self.mask
+            and (self.value ^ other.value) & self.mask == 0
         )
 
+    def iter_covered_values(self) -> Iterator[int]:
+        """Yield the value of every full-length minterm this term covers (all fillings of its dashes)."""
+        dashes = ((1 << self.length) - 1) & ~self.mask
+        sub = dashes
+        while True:
+            yield self.value | sub
+            if not sub:
+                return
+            sub = (sub - 1) & dashes
+
     def __repr__(self) -> str:
         """Return binary_form string."""
         return self.binary_form
@@ -1,20 +1,28 @@
-"""Utility functions for variable and minterm normalization and binary formatting."""
+"""Utility functions for variable and minterm normalization, binary formatting, and bitmasks."""
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 
 def normalize_variables(variables: list[str]) -> list[str]:
     """Return list of variables with duplicates removed, preserving order."""
-    seen: set[str] = set()
-    return [var for var in variables if var not in seen]
+    return list(dict.fromkeys(variables))
 
 
 def normalize_minterms(minterms: list[int]) -> list[int]:
     """Return list of minterms with duplicates removed, preserving order."""
-    seen: set[int] = set()
-    return [minterm for minterm in minterms if minterm not in seen]
+    return list(dict.fromkeys(minterms))
 
 
 def to_binary_form(number: int, length: int = 0) -> str:
     """Format number as binary string, zero-padded to length if length > 0."""
     return f"{number:0{length}b}"
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
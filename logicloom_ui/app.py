@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import QApplication
 
 from . import __app_name__, __version__
 from .main_window import MainWindow
+from .workers import shutdown_pool
 
 _ICON_PATH = Path(__file__).resolve().parent / "icon.ico"
 
@@ -16,6 +17,7 @@ def main() -> None:
     """Create and run the LogicLoom GUI application."""
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.aboutToQuit.connect(shutdown_pool)
     app.setWindowIcon(QIcon(str(_ICON_PATH)))
     font = QFont("Outfit", 10)
     app.setFont(font)
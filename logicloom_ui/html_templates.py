@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 
 def empty_html(placeholder: str) -> str:
     """Return a minimal dark-themed HTML page with the given placeholder text."""
@@ -19,12 +21,7 @@ def render_equations_html(equations: list[dict[str, str]]) -> str:
     """Return full HTML page with equation strings escaped and styled."""
     parts = []
     for eq in equations:
-        text = (
-            eq["string"]
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        text = eq["string"].translate(_HTML_ESCAPE_TABLE)
         parts.append(
             "<p style=\"margin:0 0 6px 0;font-size:18px;"
             "font-family:'JetBrains Mono',Consolas,monospace;\">"
@@ -2,34 +2,25 @@
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 from pathlib import Path
 import sys
 
 
 def _load_logicloom():
     """Import LogicGateSimplifier from logicloom; add logicloom_core to path if needed."""
-    try:
-        from logicloom import LogicGateSimplifier
-    except ImportError as exc:
+    if importlib.util.find_spec("logicloom") is None:
         repo_root = Path(__file__).resolve().parents[1]
         local_pkg = repo_root / "logicloom_core"
         if local_pkg.exists():
             sys.path.insert(0, str(local_pkg))
-            try:
-                from logicloom import LogicGateSimplifier
-            except ImportError:
-                raise ImportError(
-                    "LogicLoom package not found. Install 'logicloom' or "
-                    "ensure 'logicloom_core' is available."
-                ) from exc
-            else:
-                return LogicGateSimplifier
-        raise ImportError(
-            "LogicLoom package not found. Install 'logicloom' or "
-            "ensure 'logicloom_core' is available."
-        ) from exc
-    else:
-        return LogicGateSimplifier
+        if importlib.util.find_spec("logicloom") is None:
+            raise ImportError(
+                "LogicLoom package not found. Install 'logicloom' or "
+                "ensure 'logicloom_core' is available."
+            )
+    return importlib.import_module("logicloom").LogicGateSimplifier
 
 
 LogicGateSimplifier = _load_logicloom()
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    QThreadPool,
+    QUrl,
+)
 from PyQt6.QtWidgets import (
     QFrame,
     QLabel,
@@ -13,18 +23,188 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QTabWidget,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 from .html_templates import empty_html, render_equations_html, render_latex_html
-from .validation import validate_minterms, validate_variables
-from .workers import ComputeWorker
+from .validation import (
+    check_minterms,
+    check_variables,
+    validate_minterms,
+    validate_variables,
+)
+from .workers import ComputeJob, ValidationSignals, ValidationTask
 
 _APP_ROOT = Path(__file__).resolve().parents[1]
+_BASE_URL = QUrl.fromLocalFile(str(_APP_ROOT) + "/")
+
+_QSS = """
+QMainWindow { background-color: #0f1419; }
+QWidget { background-color: transparent; color: #e6edf3; }
+QLabel { color: #8b9cb8; font-size: 13px; }
+#inputCard {
+    background-color: #1a2332;
+    border: 1px solid #2d3a4f;
+    border-radius: 12px;
+    padding: 16px;
+}
+QLineEdit {
+    background-color: #243044;
+    border: 1px solid #2d3a4f;
+    border-radius: 8px;
+    padding: 10px 12px;
+    color: #e6edf3;
+    font-size: 14px;
+    font-family: "JetBrains Mono", "Consolas", monospace;
+}
+QLineEdit:focus { border-color: #3b82f6; }
+QLineEdit:disabled { color: #6b7a8e; }
+QPushButton {
+    background-color: #3b82f6;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    font-size: 14px;
+    font-weight: 600;
+}
+QPushButton:hover:!disabled { background-color: #60a5fa; }
+QPushButton:pressed:!disabled { background-color: #2563eb; }
+QPushButton:disabled { background-color: #2d3a4f; color: #6b7a8e; }
+QTabWidget::pane {
+    background-color: #1a2332;
+    border: 1px solid #2d3a4f;
+    border-radius: 12px;
+    margin-top: -1px;
+}
+QTabBar::tab {
+    background-color: #243044;
+    color: #8b9cb8;
+    padding: 10px 20px;
+    margin-right: 4px;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+}
+QTabBar::tab:selected { background-color: #1a2332; color: #e6edf3; }
+QTabBar::tab:hover:!selected { background-color: #2d3a4f; }
+QTableView {
+    background-color: #1a2332;
+    color: #e6edf3;
+    gridline-color: #2d3a4f;
+    border: none;
+}
+QTableView::item { padding: 8px; }
+QHeaderView::section {
+    background-color: #243044;
+    color: #8b9cb8;
+    padding: 10px;
+    border: none;
+    font-weight: 600;
+}
+QScrollArea { background-color: #1a2332; border: none; }
+QStatusBar { background-color: #1a2332; color: #8b9cb8; }
+#authorCredit {
+    color: #6b7a8e;
+    font-size: 12px;
+    padding: 8px 0 4px 0;
+}
+#authorCredit a { color: #60a5fa; text-decoration: none; }
+QLabel#inputError {
+    color: #ef4444;
+    font-size: 12px;
+    padding: 4px 0 0 0;
+}
+"""
+
+
+@contextmanager
+def _bulk_update(table: QTableWidget) -> Iterator[None]:
+    """Suspend repaints, sorting, and signals on table while filling it; repaint once afterwards."""
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    blocked = table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(blocked)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+
+def _equations_key(
+    equations: list[dict[str, str]],
+) -> tuple[tuple[tuple[str, str], ...], ...]:
+    """Return a hashable form of equations for the HTML render caches."""
+    return tuple(tuple(eq.items()) for eq in equations)
+
+
+@lru_cache(maxsize=32)
+def _cached_equations_html(key: tuple[tuple[tuple[str, str], ...], ...]) -> str:
+    """Return render_equations_html for the equations encoded by key."""
+    return render_equations_html([dict(items) for items in key])
+
+
+@lru_cache(maxsize=32)
+def _cached_latex_html(key: tuple[tuple[tuple[str, str], ...], ...]) -> str:
+    """Return render_latex_html for the equations encoded by key."""
+    return render_latex_html([dict(items) for items in key])
+
+
+class PIChartModel(QAbstractTableModel):
+    """Read-only PI chart model serving cells on demand from simplifier.pichart rows."""
+
+    def __init__(self, pichart: list, pis_sorted: list, parent: QObject | None = None):
+        """Store chart rows, column prime implicants, and per-row PI bitmasks; column 0 is the minterm."""
+        super().__init__(parent)
+        self._rows = pichart
+        self._cols = pis_sorted
+        pi_to_bit = {pi: 1 << i for i, pi in enumerate(pis_sorted)}
+        self._present: list[int] = []
+        for row in pichart:
+            bits = 0
+            for pi in row.prime_implicants:
+                bits |= pi_to_bit[pi]
+            self._present.append(bits)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return one row per minterm."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the minterm column plus one column per prime implicant."""
+        return 0 if parent.isValid() else len(self._cols) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return minterm binary in column 0 and "x" where the column's PI covers the row."""
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self._rows[index.row()].minterm.binary_form
+            return "x" if self._present[index.row()] >> (col - 1) & 1 else None
+        if role == Qt.ItemDataRole.TextAlignmentRole and col > 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        """Return "Minterm" and PI binaries across the top, minterm numbers down the side."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return "Minterm" if section == 0 else self._cols[section - 1].binary_form
+        return str(self._rows[section].minterm.number)
 
 
 class MainWindow(QMainWindow):
@@ -93,30 +273,35 @@ class MainWindow(QMainWindow):
         self.essentials_table = QTableWidget()
         self.tabs.addTab(self.essentials_table, "Essentials")
 
-        self.chart_table = QTableWidget()
+        self.chart_table = QTableView()
         self.tabs.addTab(self.chart_table, "PI Chart")
 
-        self.normal_form_view = QWebEngineView()
-        self.normal_form_view.setHtml(
-            empty_html("Results will appear here after Compute."),
-            QUrl.fromLocalFile(str(_APP_ROOT) + "/"),
-        )
+        self._web_profile: QWebEngineProfile | None = None
+        self.normal_form_view: QWebEngineView | None = None
+        self._normal_form_html = empty_html("Results will appear here after Compute.")
         self.normal_form_scroll = QScrollArea()
         self.normal_form_scroll.setWidgetResizable(True)
-        self.normal_form_scroll.setWidget(self.normal_form_view)
+        self.normal_form_scroll.setWidget(QLabel("Loading..."))
         self.tabs.addTab(self.normal_form_scroll, "Results")
 
-        self.latex_view = QWebEngineView()
-        self.latex_view.setHtml(
-            empty_html("LaTeX results will appear here after Compute."),
-            QUrl.fromLocalFile(str(_APP_ROOT) + "/"),
-        )
+        self.latex_view: QWebEngineView | None = None
+        self._latex_html = empty_html("LaTeX results will appear here after Compute.")
         self.latex_scroll = QScrollArea()
         self.latex_scroll.setWidgetResizable(True)
-        self.latex_scroll.setWidget(self.latex_view)
+        self.latex_scroll.setWidget(QLabel("Loading..."))
         self.tabs.addTab(self.latex_scroll, "LaTeX Results")
 
         main_layout.addWidget(self.tabs)
+        self._tab_fillers = [
+            self._fill_pi,
+            self._fill_essentials,
+            self._fill_chart,
+            self._fill_results,
+            self._fill_latex,
+        ]
+        self._tab_dirty: set[int] = set()
+        self._pis_sorted: list | None = None
+        self._equations: list[dict[str, str]] | None = None
 
         author_label = QLabel(
             "Author: <b>Mojtaba Akhbari</b> · "
@@ -126,109 +311,91 @@ class MainWindow(QMainWindow):
         author_label.setObjectName("authorCredit")
         main_layout.addWidget(author_label)
 
-        self._validation_timer = QTimer(self)
-        self._validation_timer.setSingleShot(True)
-        self._validation_timer.timeout.connect(self._run_validation)
+        self._validation_token = 0
+        self._validation_signals = ValidationSignals(self)
 
         self.statusBar().setStyleSheet("")
 
     def apply_styles(self) -> None:
         """Apply dark-theme stylesheet to the window and widgets."""
-        self.setStyleSheet(
-            """
-            QMainWindow { background-color: #0f1419; }
-            QWidget { background-color: transparent; color: #e6edf3; }
-            QLabel { color: #8b9cb8; font-size: 13px; }
-            #inputCard {
-                background-color: #1a2332;
-                border: 1px solid #2d3a4f;
-                border-radius: 12px;
-                padding: 16px;
-            }
-            QLineEdit {
-                background-color: #243044;
-                border: 1px solid #2d3a4f;
-                border-radius: 8px;
-                padding: 10px 12px;
-                color: #e6edf3;
-                font-size: 14px;
-                font-family: "JetBrains Mono", "Consolas", monospace;
-            }
-            QLineEdit:focus { border-color: #3b82f6; }
-            QLineEdit:disabled { color: #6b7a8e; }
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover:!disabled { background-color: #60a5fa; }
-            QPushButton:pressed:!disabled { background-color: #2563eb; }
-            QPushButton:disabled { background-color: #2d3a4f; color: #6b7a8e; }
-            QTabWidget::pane {
-                background-color: #1a2332;
-                border: 1px solid #2d3a4f;
-                border-radius: 12px;
-                margin-top: -1px;
-            }
-            QTabBar::tab {
-                background-color: #243044;
-                color: #8b9cb8;
-                padding: 10px 20px;
-                margin-right: 4px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-            QTabBar::tab:selected { background-color: #1a2332; color: #e6edf3; }
-            QTabBar::tab:hover:!selected { background-color: #2d3a4f; }
-            QTableWidget {
-                background-color: #1a2332;
-                color: #e6edf3;
-                gridline-color: #2d3a4f;
-                border: none;
-            }
-            QTableWidget::item { padding: 8px; }
-            QHeaderView::section {
-                background-color: #243044;
-                color: #8b9cb8;
-                padding: 10px;
-                border: none;
-                font-weight: 600;
-            }
-            QScrollArea { background-color: #1a2332; border: none; }
-            QStatusBar { background-color: #1a2332; color: #8b9cb8; }
-            #authorCredit {
-                color: #6b7a8e;
-                font-size: 12px;
-                padding: 8px 0 4px 0;
-            }
-            #authorCredit a { color: #60a5fa; text-decoration: none; }
-            QLabel#inputError {
-                color: #ef4444;
-                font-size: 12px;
-                padding: 4px 0 0 0;
-            }
-        """
-        )
+        self.setStyleSheet(_QSS)
 
     def connect_signals(self) -> None:
-        """Connect compute button and input change signals to slots."""
+        """Connect compute button, user input edits, validation results, and tab changes to slots."""
         self.compute_btn.clicked.connect(self.start_compute)
-        self.var_input.textChanged.connect(self._on_input_changed)
-        self.minterm_input.textChanged.connect(self._on_input_changed)
+        self.var_input.textEdited.connect(self._on_input_changed)
+        self.minterm_input.textEdited.connect(self._on_input_changed)
+        self._validation_signals.finished.connect(self._on_validation_finished)
+        self.tabs.currentChanged.connect(self._maybe_fill)
+        self.tabs.currentChanged.connect(self._ensure_webview)
+
+    def _ensure_webview(self, index: int) -> None:
+        """Create the Results or LaTeX web view the first time its tab is shown."""
+        widget = self.tabs.widget(index)
+        if widget is self.normal_form_scroll and self.normal_form_view is None:
+            self.normal_form_view = self._make_webview(
+                self.normal_form_scroll, self._normal_form_html
+            )
+        elif widget is self.latex_scroll and self.latex_view is None:
+            self.latex_view = self._make_webview(self.latex_scroll, self._latex_html)
+
+    def _make_webview(self, scroll: QScrollArea, html: str) -> QWebEngineView:
+        """Build a QWebEngineView showing html and place it in scroll, replacing the placeholder."""
+        view = QWebEngineView()
+        view.setPage(QWebEnginePage(self._get_web_profile(), view))
+        view.setHtml(html, _BASE_URL)
+        scroll.setWidget(view)
+        return view
+
+    def _get_web_profile(self) -> QWebEngineProfile:
+        """Return the off-the-record profile shared by both web views, creating it on first use."""
+        if self._web_profile is None:
+            self._web_profile = QWebEngineProfile(self)
+            self._web_profile.setHttpCacheType(
+                QWebEngineProfile.HttpCacheType.MemoryHttpCache
+            )
+            self._web_profile.setPersistentCookiesPolicy(
+                QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies
+            )
+        return self._web_profile
 
     def _on_input_changed(self) -> None:
-        """Restart debounced validation timer when input text changes."""
-        self._validation_timer.stop()
-        self._validation_timer.start(500)
+        """Queue validation of the current input on the thread pool, superseding any pending run."""
+        self._validation_token += 1
+        QThreadPool.globalInstance().start(
+            ValidationTask(
+                self._validation_signals,
+                self._validation_token,
+                self.var_input.text(),
+                self.minterm_input.text(),
+            )
+        )
+
+    def _on_validation_finished(
+        self,
+        token: int,
+        var_result: tuple[bool, str | None],
+        minterm_result: tuple[bool, str | None],
+    ) -> None:
+        """Show validation results from the thread pool unless newer input has superseded them."""
+        if token == self._validation_token:
+            self._show_validation(var_result, minterm_result)
 
     def _run_validation(self) -> None:
-        """Validate variables and minterms and show or hide error labels."""
-        v_ok, v_err = validate_variables(self.var_input.text())
-        m_ok, m_err = validate_minterms(self.minterm_input.text())
+        """Validate variables and minterms on the GUI thread and show or hide error labels."""
+        self._show_validation(
+            validate_variables(self.var_input.text()),
+            validate_minterms(self.minterm_input.text()),
+        )
+
+    def _show_validation(
+        self,
+        var_result: tuple[bool, str | None],
+        minterm_result: tuple[bool, str | None],
+    ) -> None:
+        """Show or hide error labels for the given variables and minterms validation results."""
+        v_ok, v_err = var_result
+        m_ok, m_err = minterm_result
         if v_ok:
             self.var_error.hide()
             self.var_error.clear()
@@ -253,16 +420,16 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Ready.")
 
     def start_compute(self) -> None:
-        """Validate inputs, start ComputeWorker, and run simplification in a background thread."""
-        self._validation_timer.stop()
+        """Validate and parse inputs, start ComputeJob, and run simplification in a worker process."""
+        self._validation_token += 1
         self._run_validation()
-        variables = self.var_input.text().strip()
-        minterms = self.minterm_input.text().strip()
-        if not variables or not minterms:
+        variables = self.var_input.text()
+        minterms = self.minterm_input.text()
+        if not variables.strip() or not minterms.strip():
             self.statusBar().showMessage("Please enter both variables and minterms.")
             return
-        v_ok, v_err = validate_variables(variables)
-        m_ok, m_err = validate_minterms(minterms)
+        v_ok, v_err, var_names = check_variables(variables)
+        m_ok, m_err, minterm_nums = check_minterms(minterms)
         if not v_ok:
             self.var_error.setText(v_err or "")
             self.var_error.show()
@@ -274,7 +441,7 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Fix minterms input.")
             return
         self.set_computing(True)
-        self._worker = ComputeWorker(variables, minterms)
+        self._worker = ComputeJob(var_names, minterm_nums)
         self._worker.finished.connect(self.on_compute_finished)
         self._worker.error.connect(self.on_compute_error)
         self._worker.start()
@@ -294,55 +461,91 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Error: {message}")
 
     def fill_tabs(self) -> None:
-        """Populate Prime Implicants, Essentials, PI Chart, Results, and LaTeX tabs from current simplifier."""
+        """Mark every result tab stale and populate the visible one; the rest fill when first shown."""
         if not self._simplifier:
             return
-        simplifier = self._simplifier
-        vars_list = simplifier.variables
-
-        pis = sorted(simplifier.prime_implicants, key=lambda t: t.binary_form)
-        self.pi_table.setRowCount(len(pis))
-        self.pi_table.setColumnCount(2)
-        self.pi_table.setHorizontalHeaderLabels(["Binary", "Literal"])
-        for row, term in enumerate(pis):
-            self.pi_table.setItem(row, 0, QTableWidgetItem(term.binary_form))
-            self.pi_table.setItem(
-                row, 1, QTableWidgetItem(term.to_normal_expression(vars_list))
+        self._pis_sorted = None
+        self._equations = None
+        self._tab_dirty = set(range(self.tabs.count()))
+        self._maybe_fill(self.tabs.currentIndex())
+
+    def _maybe_fill(self, index: int) -> None:
+        """Populate the tab at index from the current simplifier if it is stale."""
+        if index not in self._tab_dirty:
+            return
+        self._tab_dirty.discard(index)
+        self._tab_fillers[index]()
+
+    def _get_pis_sorted(self) -> list:
+        """Return the current prime implicants sorted by binary form, sorting once per result."""
+        if self._pis_sorted is None:
+            self._pis_sorted = sorted(
+                self._simplifier.prime_implicants, key=lambda t: t.binary_form
             )
+        return self._pis_sorted
+
+    def _get_equations(self) -> list[dict[str, str]]:
+        """Return the current simplifier's equations, computing them once per result."""
+        if self._equations is None:
+            self._equations = self._simplifier.get_all_equations()
+        return self._equations
+
+    def _fill_pi(self) -> None:
+        """Populate the Prime Implicants table."""
+        pis_sorted = self._get_pis_sorted()
+        vars_list = self._simplifier.variables
+        with _bulk_update(self.pi_table):
+            self.pi_table.setRowCount(len(pis_sorted))
+            self.pi_table.setColumnCount(2)
+            self.pi_table.setHorizontalHeaderLabels(["Binary", "Literal"])
+            set_item = self.pi_table.setItem
+            new = QTableWidgetItem
+            for row, term in enumerate(pis_sorted):
+                set_item(row, 0, new(term.binary_form))
+                set_item(row, 1, new(term.to_normal_expression(vars_list)))
         self.pi_table.resizeColumnsToContents()
 
-        self.essentials_table.setRowCount(len(simplifier.essentials))
-        self.essentials_table.setColumnCount(2)
-        self.essentials_table.setHorizontalHeaderLabels(["Binary", "Literal"])
-        for row, term in enumerate(simplifier.essentials):
-            self.essentials_table.setItem(row, 0, QTableWidgetItem(term.binary_form))
-            self.essentials_table.setItem(
-                row, 1, QTableWidgetItem(term.to_normal_expression(vars_list))
-            )
+    def _fill_essentials(self) -> None:
+        """Populate the Essentials table."""
+        essentials = self._simplifier.essentials
+        vars_list = self._simplifier.variables
+        with _bulk_update(self.essentials_table):
+            self.essentials_table.setRowCount(len(essentials))
+            self.essentials_table.setColumnCount(2)
+            self.essentials_table.setHorizontalHeaderLabels(["Binary", "Literal"])
+            set_item = self.essentials_table.setItem
+            new = QTableWidgetItem
+            for row, term in enumerate(essentials):
+                set_item(row, 0, new(term.binary_form))
+                set_item(row, 1, new(term.to_normal_expression(vars_list)))
         self.essentials_table.resizeColumnsToContents()
 
-        pis_sorted = sorted(simplifier.prime_implicants, key=lambda t: t.binary_form)
-        self.chart_table.setRowCount(len(simplifier.pichart))
-        self.chart_table.setColumnCount(len(pis_sorted) + 1)
-        self.chart_table.setHorizontalHeaderLabels(
-            ["Minterm"] + [t.binary_form for t in pis_sorted]
-        )
-        for row_idx, chart_row in enumerate(simplifier.pichart):
-            self.chart_table.setVerticalHeaderItem(
-                row_idx, QTableWidgetItem(str(chart_row.minterm.number))
+    def _fill_chart(self) -> None:
+        """Point the PI Chart view at a model over the current chart rows."""
+        old_model = self.chart_table.model()
+        self.chart_table.setModel(
+            PIChartModel(
+                self._simplifier.pichart, self._get_pis_sorted(), self.chart_table
             )
-            self.chart_table.setItem(
-                row_idx, 0, QTableWidgetItem(chart_row.minterm.binary_form)
-            )
-            for col_idx, pi in enumerate(pis_sorted):
-                cell = QTableWidgetItem("x" if pi in chart_row.prime_implicants else "")
-                cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.chart_table.setItem(row_idx, col_idx + 1, cell)
+        )
+        if old_model is not None:
+            old_model.deleteLater()
         self.chart_table.resizeColumnsToContents()
 
-        equations = simplifier.get_all_equations()
-        self.normal_form_view.setHtml(render_equations_html(equations))
-
-        latex_html = render_latex_html(equations)
-        base_url = QUrl.fromLocalFile(str(_APP_ROOT) + "/")
-        self.latex_view.setHtml(latex_html, base_url)
+    def _fill_results(self) -> None:
+        """Render the equations page and show it if it changed and the Results view exists."""
+        html = _cached_equations_html(_equations_key(self._get_equations()))
+        if html == self._normal_form_html:
+            return
+        self._normal_form_html = html
+        if self.normal_form_view is not None:
+            self.normal_form_view.setHtml(self._normal_form_html)
+
+    def _fill_latex(self) -> None:
+        """Render the LaTeX page and show it if it changed and the LaTeX view exists."""
+        html = _cached_latex_html(_equations_key(self._get_equations()))
+        if html == self._latex_html:
+            return
+        self._latex_html = html
+        if self.latex_view is not None:
+            self.latex_view.setHtml(self._latex_html, _BASE_URL)
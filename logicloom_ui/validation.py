@@ -1,29 +1,48 @@
 """Input validation for variables and minterms text."""
 
+import re
+from functools import lru_cache
 
-def validate_variables(text: str) -> tuple[bool, str | None]:
-    """Return (True, None) if valid comma-separated variables (letters only), else (False, error_message)."""
+_SEPARATORS_RE = re.compile(r"[\s,]*")
+_VARIABLES_RE = re.compile(r"\s*(?:[A-Za-z]+\s*)?(?:,\s*(?:[A-Za-z]+\s*)?)*")
+_MINTERMS_RE = re.compile(r"\s*(?:[0-9]+\s*)?(?:,\s*(?:[0-9]+\s*)?)*")
+
+
+@lru_cache(maxsize=256)
+def check_variables(text: str) -> tuple[bool, str | None, tuple[str, ...]]:
+    """Validate and parse variables text; return (ok, error_message, de-duplicated names in input order)."""
     text = text.strip()
     if not text:
-        return True, None
-    parts = [p.strip() for p in text.split(",") if p.strip()]
-    if not parts:
-        return False, "At least one variable required."
-    for p in parts:
-        if not p.isalpha() or not all(c.isascii() and c.isalpha() for c in p):
-            return False, "Use only English letters (a-z, A-Z), comma-separated."
-    return True, None
+        return True, None, ()
+    if _SEPARATORS_RE.fullmatch(text):
+        return False, "At least one variable required.", ()
+    if not _VARIABLES_RE.fullmatch(text):
+        return False, "Use only English letters (a-z, A-Z), comma-separated.", ()
+    parts = dict.fromkeys(p.strip() for p in text.split(",") if p.strip())
+    return True, None, tuple(parts)
 
 
-def validate_minterms(text: str) -> tuple[bool, str | None]:
-    """Return (True, None) if valid comma-separated minterm numbers, else (False, error_message)."""
+@lru_cache(maxsize=256)
+def check_minterms(text: str) -> tuple[bool, str | None, tuple[int, ...]]:
+    """Validate and parse minterms text; return (ok, error_message, de-duplicated numbers in input order)."""
     text = text.strip()
     if not text:
-        return True, None
-    parts = [p.strip() for p in text.split(",") if p.strip()]
-    if not parts:
-        return False, "At least one minterm required."
-    for p in parts:
-        if not p.isdigit():
-            return False, "Use only numbers (0, 1, 2, ...), comma-separated."
-    return True, None
+        return True, None, ()
+    if _SEPARATORS_RE.fullmatch(text):
+        return False, "At least one minterm required.", ()
+    if not _MINTERMS_RE.fullmatch(text):
+        return False, "Use only numbers (0, 1, 2, ...), comma-separated.", ()
+    parts = dict.fromkeys(int(p.strip()) for p in text.split(",") if p.strip())
+    return True, None, tuple(parts)
+
+
+def validate_variables(text: str) -> tuple[bool, str | None]:
+    """Return (True, None) if valid comma-separated variables (letters only), else (False, error_message)."""
+    ok, err, _ = check_variables(text)
+    return ok, err
+
+
+def validate_minterms(text: str) -> tuple[bool, str | None]:
+    """Return (True, None) if valid comma-separated minterm numbers, else (False, error_message)."""
+    ok, err, _ = check_minterms(text)
+    return ok, err
@@ -1,29 +1,155 @@
-"""Background worker for running LogicGateSimplifier.simplify()."""
+"""Background workers for running LogicGateSimplifier.simplify() and input validation."""
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 from .logicloom_client import LogicGateSimplifier
+from .validation import validate_minterms, validate_variables
+
+_SIMPLIFIER_CACHE_SIZE = 32
+_SIMPLIFIER_CACHE: OrderedDict[tuple[tuple[str, ...], tuple[int, ...]], object] = (
+    OrderedDict()
+)
+_SIMPLIFIER_CACHE_LOCK = threading.Lock()
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _cache_get(key: tuple[tuple[str, ...], tuple[int, ...]]) -> object | None:
+    """Return the cached simplifier for key (marking it most recently used), or None."""
+    with _SIMPLIFIER_CACHE_LOCK:
+        simplifier = _SIMPLIFIER_CACHE.get(key)
+        if simplifier is not None:
+            _SIMPLIFIER_CACHE.move_to_end(key)
+        return simplifier
+
+
+def _cache_put(
+    key: tuple[tuple[str, ...], tuple[int, ...]], simplifier: object
+) -> None:
+    """Store simplifier under key, evicting the least recently used entry when full."""
+    with _SIMPLIFIER_CACHE_LOCK:
+        _SIMPLIFIER_CACHE[key] = simplifier
+        if len(_SIMPLIFIER_CACHE) > _SIMPLIFIER_CACHE_SIZE:
+            _SIMPLIFIER_CACHE.popitem(last=False)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared single-worker process pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        # Spawn, never fork: the GUI process already runs Qt threads. One worker is
+        # enough because Compute is disabled while a job runs.
+        _POOL = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget pool if it is still the shared one so the next job starts a fresh pool."""
+    global _POOL
+    if _POOL is pool:
+        _POOL = None
+
+
+def shutdown_pool() -> None:
+    """Cancel pending jobs and terminate pool workers so quitting never waits on a running simplify()."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is None:
+        return
+    # Executor has no public way to stop a running task before Python 3.14.
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def _compute(
+    variables: tuple[str, ...], minterms: tuple[int, ...]
+) -> LogicGateSimplifier:
+    """Build and simplify a LogicGateSimplifier in a worker process; return it for pickling back."""
+    simplifier = LogicGateSimplifier(minterms=list(minterms), variables=list(variables))
+    simplifier.simplify()
+    return simplifier
 
 
-class ComputeWorker(QThread):
-    """QThread that builds a LogicGateSimplifier from strings and runs simplify(); emits result or error."""
+class ComputeJob(QObject):
+    """Runs simplify() in the process pool (or reuses a cached result); emits result or error on the GUI thread."""
 
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+    _done = pyqtSignal(object)
 
-    def __init__(self, variables_str: str, minterms_str: str):
-        """Store comma-separated variable and minterm strings for the worker."""
+    def __init__(self, variables: tuple[str, ...], minterms: tuple[int, ...]):
+        """Store already parsed variable names and minterm numbers for the job."""
         super().__init__()
-        self.variables_str = variables_str
-        self.minterms_str = minterms_str
+        self._key = (variables, minterms)
+        self._pool: ProcessPoolExecutor | None = None
+        self._done.connect(self._deliver)
 
-    def run(self) -> None:
-        """Create simplifier, call simplify(), and emit finished(simplifier) or error(message)."""
-        try:
-            simplifier = LogicGateSimplifier.from_strings(
-                self.variables_str, self.minterms_str
-            )
-            simplifier.simplify()
+    def start(self) -> None:
+        """Emit a cached simplifier for this input, or submit the computation to the process pool."""
+        simplifier = _cache_get(self._key)
+        if simplifier is not None:
             self.finished.emit(simplifier)
-        except Exception as exc:
+            return
+        self._pool = _get_pool()
+        try:
+            future = self._pool.submit(_compute, *self._key)
+        except BrokenProcessPool:
+            _discard_pool(self._pool)
+            self._pool = _get_pool()
+            future = self._pool.submit(_compute, *self._key)
+        future.add_done_callback(self._done.emit)
+
+    def _deliver(self, future: Future) -> None:
+        """Cache and emit finished(simplifier), or emit error(message), once the pool result arrives."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            if isinstance(exc, BrokenProcessPool):
+                _discard_pool(self._pool)
             self.error.emit(str(exc))
+            return
+        simplifier = future.result()
+        _cache_put(self._key, simplifier)
+        self.finished.emit(simplifier)
+
+
+class ValidationSignals(QObject):
+    """Signal holder for ValidationTask; lives on the GUI thread so slots run there."""
+
+    finished = pyqtSignal(int, object, object)
+
+
+class ValidationTask(QRunnable):
+    """QRunnable that validates variables and minterms text; emits finished(token, var_result, minterm_result)."""
+
+    def __init__(
+        self,
+        signals: ValidationSignals,
+        token: int,
+        variables_text: str,
+        minterms_text: str,
+    ):
+        """Store the signal holder, request token, and the input texts to validate."""
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.variables_text = variables_text
+        self.minterms_text = minterms_text
+
+    def run(self) -> None:
+        """Validate both inputs and emit the results tagged with this task's token."""
+        self.signals.finished.emit(
+            self.token,
+            validate_variables(self.variables_text),
+            validate_minterms(self.minterms_text),
+        )